@@ -4,31 +4,149 @@ import re
 import time
 import json
 import getpass
+import queue
+import threading
 from datetime import datetime, date
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-import pandas as pd
-from PyPDF2 import PdfReader
+from openpyxl import Workbook
+from pypdf import PdfReader
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
 
+PORTAL_URL = "https://portal.eoir.justice.gov/"
+CACHE_DIR = Path.home() / ".cache" / "ecas-downloader"
+PROFILE_DIR = CACHE_DIR / "profile"
+_DRIVER_PATH_CACHE = CACHE_DIR / "chromedriver_path.txt"
+DEFAULT_WORKERS = 4
+HEADERS = (
+    "A-Number",
+    "Document Label (ECAS)",
+    "Pleading Name (pg1)",
+    "Filing Date (ECAS)",
+    "Relevant Dates (extracted)",
+    "Filename (final)",
+)
+# serializes the collision probe + rename when workers share an output folder
+_RENAME_LOCK = threading.Lock()
+
+_WS_RE = re.compile(r"\s+")
+_SANITIZE_TABLE = str.maketrans({
+    "/": "-", "\\": "-", ":": " - ", "*": "", "?": "", '"': "'", "<": "(", ">": ")", "|": "-",
+})
+_ISO_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_US_RE = re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b")
+_FAST_DATE = re.compile(
+    r"(?P<y1>\d{4})-(?P<m1>\d{1,2})-(?P<d1>\d{1,2})"
+    r"|(?P<m2>\d{1,2})/(?P<d2>\d{1,2})/(?P<y2>\d{4}|\d{2})"
+    r"|(?P<m3>\d{1,2})-(?P<d3>\d{1,2})-(?P<y3>\d{4})"
+    r"|(?P<mon>[A-Za-z]{3,9})\s+(?P<d4>\d{1,2}),\s+(?P<y4>\d{4})"
+)
+_MONTHS = {key: i for i, name in enumerate((
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+), 1) for key in (name, name[:3])}
+_DATE_RE = r"(?:\w{3,9}\s+\d{1,2},\s+\d{4})|(?:\d{1,2}/\d{1,2}/\d{2,4})"
+_DATE_PATTERNS = [(re.compile(pat, re.I), label) for pat, label in (
+    (rf"(hearing (?:is )?set (?:for|on)\s+(?P<date>{_DATE_RE}))", "HEARING"),
+    (rf"(individual hearing on\s+(?P<date>{_DATE_RE}))", "HEARING"),
+    (rf"(master hearing on\s+(?P<date>{_DATE_RE}))", "HEARING"),
+    (rf"((?:applications?|relief|brief|evidence|documents?)\s+(?:are\s+)?due\s+(?:by|on)\s+(?P<date>{_DATE_RE}))", "DUE"),
+    (rf"(deadline(?:s)?\s+(?:set|is|are)\s+(?:for|on)\s+(?P<date>{_DATE_RE}))", "DEADLINE"),
+)]
+_KW_BONUS = 0.15
+_MAX_PLEADING_SCORE = 1.0 + _KW_BONUS
+_PLEADING_KEYWORDS = ("MOTION", "ORDER", "NOTICE", "EVIDENCE", "APPLICATION", "BRIEF", "DECLARATION", "EXHIBIT", "SUBMISSION")
+# matched against the upper-cased line; a case-sensitive literal alternation is ~2x faster than re.I
+_PLEADING_KW = re.compile(r"\b(?:" + "|".join(_PLEADING_KEYWORDS) + r")\b")
+_HEARING_DATE_RE = re.compile(r"Hearing Date:\s*([^\n]+)", re.I)
+_ANUM_RE = re.compile(r"A[#\-\s]*\s*(\d{3}[-\s]?\d{3}[-\s]?\d{3})")
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+
+# Opens one calendar day cell's hearing popup and returns its text (or null) in a
+# single WebDriver round-trip. Each step polls for the next element instead of
+# sleeping a fixed time.
+# args: cell, day_number_in_cell, hearing_dot, overlay_row, dialog, close, dialog_timeout_ms, done
+_DAY_CELL_JS = """
+const [cell, dayXp, dotXp, rowXp, dialogXp, closeXp, timeoutMs, done] = arguments;
+const first = (xp, ctx) => document.evaluate(
+    xp, ctx || document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const visible = el => !!el && el.getClientRects().length > 0;
+const waitFor = async (cond, ms) => {
+    let v;
+    for (const end = Date.now() + ms; !(v = cond()) && Date.now() < end;) {
+        await new Promise(r => setTimeout(r, 50));
+    }
+    return v;
+};
+(async () => {
+    try { first(dayXp, cell)?.click(); } catch (e) {}
+    try { first(dotXp, cell)?.click(); } catch (e) {}
+    const shown = xp => { const el = first(xp); return visible(el) && el; };
+    const row = await waitFor(() => shown(rowXp), 500);
+    if (row) {
+        try { row.click(); } catch (e) {}
+    }
+    const popup = await waitFor(() => shown(dialogXp), timeoutMs);
+    if (!popup) return null;
+    const text = popup.innerText;
+    const close = first(closeXp, popup);
+    if (close) close.click(); else document.activeElement?.blur();
+    await waitFor(() => !visible(popup) && !visible(first(dialogXp)), 1000);
+    return text;
+})().then(done, () => done(null));
+"""
+
+@lru_cache(maxsize=2048)
 def sanitize(s: str) -> str:
     if not s:
         return ""
-    s = s.replace("/", "-").replace("\\", "-").replace(":", " - ")
-    s = s.replace("*", "").replace("?", "").replace('"', "'").replace("<", "(").replace(">", ")").replace("|", "-")
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s.translate(_SANITIZE_TABLE)).strip()
 
+def _fast_date(s: str) -> str:
+    m = _FAST_DATE.fullmatch(s)
+    if not m:
+        return ""
+    g = m.groupdict()
+    try:
+        if g["y1"]:
+            dt = date(int(g["y1"]), int(g["m1"]), int(g["d1"]))
+        elif g["y2"]:
+            y = int(g["y2"])
+            if len(g["y2"]) == 2:
+                y += 2000 if y < 69 else 1900
+            dt = date(y, int(g["m2"]), int(g["d2"]))
+        elif g["y3"]:
+            dt = date(int(g["y3"]), int(g["m3"]), int(g["d3"]))
+        else:
+            mon = _MONTHS.get(g["mon"].lower())
+            if not mon:
+                return ""
+            dt = date(int(g["y4"]), mon, int(g["d4"]))
+    except ValueError:
+        return ""
+    return dt.strftime("%m-%d-%Y")
+
+@lru_cache(maxsize=4096)
 def parse_date_any(s: str) -> str:
     if not s:
         return ""
     s = s.strip()
+    fast = _fast_date(s)
+    if fast:
+        return fast
     fmts = ["%m/%d/%Y", "%m-%d-%Y", "%Y-%m-%d", "%m/%d/%y", "%b %d, %Y", "%B %d, %Y"]
     for f in fmts:
         try:
@@ -36,14 +154,14 @@ def parse_date_any(s: str) -> str:
             return dt.strftime("%m-%d-%Y")
         except Exception:
             pass
-    m = re.search(r"\b(\d{4})-(\d{2})-(\d{2})\b", s)
+    m = _ISO_RE.search(s)
     if m:
         try:
             dt = datetime.strptime(m.group(0), "%Y-%m-%d")
             return dt.strftime("%m-%d-%Y")
         except Exception:
             pass
-    m = re.search(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b", s)
+    m = _US_RE.search(s)
     if m:
         try:
             dt = datetime.strptime(m.group(0), "%m/%d/%Y")
@@ -55,50 +173,45 @@ def parse_date_any(s: str) -> str:
 def extract_relevant_dates_text(text: str) -> str:
     if not text:
         return ""
-    findings = []
-    patterns = [
-        (r"(hearing (?:is )?set (?:for|on)\s+(?P<date>(?:\w{3,9}\s+\d{1,2},\s+\d{4})|(?:\d{1,2}/\d{1,2}/\d{2,4})))", "HEARING"),
-        (r"(individual hearing on\s+(?P<date>(?:\w{3,9}\s+\d{1,2},\s+\d{4})|(?:\d{1,2}/\d{1,2}/\d{2,4})))", "HEARING"),
-        (r"(master hearing on\s+(?P<date>(?:\w{3,9}\s+\d{1,2},\s+\d{4})|(?:\d{1,2}/\d{1,2}/\d{2,4})))", "HEARING"),
-        (r"((?:applications?|relief|brief|evidence|documents?)\s+(?:are\s+)?due\s+(?:by|on)\s+(?P<date>(?:\w{3,9}\s+\d{1,2},\s+\d{4})|(?:\d{1,2}/\d{1,2}/\d{2,4})))", "DUE"),
-        (r"(deadline(?:s)?\s+(?:set|is|are)\s+(?:for|on)\s+(?P<date>(?:\w{3,9}\s+\d{1,2},\s+\d{4})|(?:\d{1,2}/\d{1,2}/\d{2,4})))", "DEADLINE"),
-    ]
-    for pat, label in patterns:
-        for m in re.finditer(pat, text, flags=re.I):
-            dt = m.groupdict().get("date") or ""
+    seen = set()
+    out = []
+    for pat, label in _DATE_PATTERNS:
+        for m in pat.finditer(text):
+            dt = m.group("date")
             if dt:
-                findings.append(f"{label} {parse_date_any(dt)}")
-    findings = list(dict.fromkeys([f for f in findings if f]))
-    return " ; ".join(findings)
+                f = f"{label} {parse_date_any(dt)}"
+                if f not in seen:
+                    seen.add(f)
+                    out.append(f)
+    return " ; ".join(out)
 
 def extract_first_page_text(pdf_path: Path) -> str:
     try:
         with open(pdf_path, "rb") as f:
-            reader = PdfReader(f)
-            if not reader.pages:
-                return ""
-            return reader.pages[0].extract_text() or ""
+            page = PdfReader(f).pages[0]
+            return page.extract_text() or ""
     except Exception:
         return ""
 
 def guess_pleading_name_from_text(text: str) -> str:
     if not text:
         return ""
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
     candidate = ""
     best_score = 0.0
-    for ln in lines[:60]:
+    for ln in islice(filter(None, map(str.strip, text.splitlines())), 60):
         if len(ln) < 8:
             continue
-        letters = [c for c in ln if c.isalpha()]
+        letters = list(filter(str.isalpha, ln))
         if not letters:
             continue
-        upper_ratio = sum(1 for c in letters if c.isupper()) / len(letters) if len(letters) else 0
-        kw_bonus = 0.15 if re.search(r"\b(MOTION|ORDER|NOTICE|EVIDENCE|APPLICATION|BRIEF|DECLARATION|EXHIBIT|SUBMISSION)\b", ln, re.I) else 0.0
+        upper_ratio = sum(map(str.isupper, letters)) / len(letters)
+        kw_bonus = _KW_BONUS if _PLEADING_KW.search(ln.upper()) else 0.0
         score = upper_ratio + kw_bonus
         if score > best_score:
             best_score = score
             candidate = ln
+            if score >= _MAX_PLEADING_SCORE:
+                break
     return candidate
 
 def build_new_filename(label, pleading_name, file_date, notes):
@@ -117,80 +230,188 @@ def build_new_filename(label, pleading_name, file_date, notes):
 def ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
 
+def chromedriver_path(refresh: bool = False) -> str:
+    if not refresh:
+        try:
+            cached = _DRIVER_PATH_CACHE.read_text(encoding="utf-8").strip()
+            if cached and Path(cached).is_file():
+                return cached
+        except OSError:
+            pass
+    path = ChromeDriverManager().install()
+    try:
+        ensure_dir(CACHE_DIR)
+        _DRIVER_PATH_CACHE.write_text(path, encoding="utf-8")
+    except OSError:
+        pass
+    return path
+
+def new_log_columns() -> dict:
+    return {h: [] for h in HEADERS}
+
+def used_names_in(p: Path) -> set:
+    return {name.casefold() for name in os.listdir(p)}
+
+class _DownloadEvents(FileSystemEventHandler):
+    def __init__(self):
+        self.queue = queue.Queue()
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        path = (getattr(event, "dest_path", "") or event.src_path).lower()
+        if path.endswith((".pdf", ".crdownload")):
+            self.queue.put(path)
+
 class ECASScraper:
-    def __init__(self, download_dir: Path, selectors_path: Path):
+    def __init__(self, download_dir: Path, selectors_path: Path, output_dir: Path = None, used_names: set = None):
         self.download_dir = download_dir.resolve()
         ensure_dir(self.download_dir)
+        self.output_dir = output_dir.resolve() if output_dir else self.download_dir
+        ensure_dir(self.output_dir)
+        # casefolded names taken in output_dir; shared between workers writing to the same folder
+        self._used_names = used_names if used_names is not None else used_names_in(self.output_dir)
+        # downloading straight into the output folder: other workers' renamed files land here too
+        self._downloads_into_output = self.download_dir == self.output_dir
+        self.selectors_path = selectors_path
         with open(selectors_path, "r", encoding="utf-8") as f:
             self.sel = json.load(f)
         self.driver = None
         self.wait = None
+        self.fast_wait = None
+        self.log_cols = new_log_columns()
+        self._fs_events = _DownloadEvents()
+        self._observer = None
+        self._watch_started = False
 
-    def start(self):
+    def _chrome_options(self, profile_dir: Path = None) -> Options:
         opts = Options()
         prefs = {
             "download.default_directory": str(self.download_dir),
             "download.prompt_for_download": False,
             "download.directory_upgrade": True,
-            "safebrowsing.enabled": True
+            "safebrowsing.enabled": True,
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.default_content_setting_values.geolocation": 2,
         }
         opts.add_experimental_option("prefs", prefs)
-        service = ChromeService(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=opts)
+        opts.add_argument("--blink-settings=imagesEnabled=false")
+        opts.add_argument("--disable-gpu")
+        if profile_dir:
+            ensure_dir(profile_dir)
+            opts.add_argument(f"--user-data-dir={profile_dir}")
+        return opts
+
+    @staticmethod
+    def _launch(opts: Options):
+        try:
+            return webdriver.Chrome(service=ChromeService(chromedriver_path()), options=opts)
+        except WebDriverException as e:
+            # a locked profile also surfaces here; a new driver won't help with that
+            if "user data directory" in str(e).lower():
+                raise
+            # cached driver may no longer run or match the installed Chrome
+            return webdriver.Chrome(service=ChromeService(chromedriver_path(refresh=True)), options=opts)
+
+    def start(self, profile_dir: Path = None):
+        try:
+            self.driver = self._launch(self._chrome_options(profile_dir))
+        except Exception as e:
+            if not profile_dir:
+                raise
+            print(f"[WARN] Saved browser profile unavailable, starting without it: {e}")
+            self.driver = self._launch(self._chrome_options())
         self.wait = WebDriverWait(self.driver, 30)
+        self.fast_wait = WebDriverWait(self.driver, 5, poll_frequency=0.1)
+
+    def _nav_present(self):
+        return EC.any_of(
+            EC.presence_of_element_located((By.XPATH, self.sel["nav"]["calendar_tab"])),
+            EC.presence_of_element_located((By.XPATH, self.sel["nav"]["cases_tab"])),
+        )
+
+    def _login_form_shown(self) -> bool:
+        email_xp = self.sel["login"]["email"]
+        email_cond = EC.presence_of_element_located((By.XPATH, email_xp))
+        self.wait.until(EC.any_of(email_cond, self._nav_present()))
+        # the nav selectors also match links on public pages, which can render before
+        # the form does; give the form a short grace period before trusting its absence
+        self._settle(email_cond, WebDriverWait(self.driver, 3, poll_frequency=0.1))
+        return bool(self.driver.find_elements(By.XPATH, email_xp))
 
     def login(self, email: str, password: str):
         d = self.driver
-        d.get("https://portal.eoir.justice.gov/")
+        d.get(PORTAL_URL)
+        if not self._login_form_shown():
+            print("Reusing saved ECAS session.")
+            return
         email_box = self.wait.until(EC.presence_of_element_located((By.XPATH, self.sel["login"]["email"])))
         email_box.clear(); email_box.send_keys(email)
         pwd_box = self.wait.until(EC.presence_of_element_located((By.XPATH, self.sel["login"]["password"])))
         pwd_box.clear(); pwd_box.send_keys(password)
         submit = self.wait.until(EC.element_to_be_clickable((By.XPATH, self.sel["login"]["submit"])))
         submit.click()
-        self.wait.until(EC.any_of(
-            EC.presence_of_element_located((By.XPATH, self.sel["nav"]["calendar_tab"])),
-            EC.presence_of_element_located((By.XPATH, self.sel["nav"]["cases_tab"])),
-        ))
+        self.wait.until(self._nav_present())
+
+    def adopt_session(self, cookies: list):
+        d = self.driver
+        d.get(PORTAL_URL)
+        for c in cookies:
+            try:
+                d.add_cookie(c)
+            except Exception:
+                pass
+        d.get(PORTAL_URL)
+        if self._login_form_shown():
+            raise RuntimeError("copied cookies did not carry the ECAS login")
+
+    def close(self):
+        if self._observer:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+    def _settle(self, condition, wait=None) -> bool:
+        try:
+            (wait or self.fast_wait).until(condition)
+            return True
+        except TimeoutException:
+            return False
 
     def goto_calendar(self):
         self.wait.until(EC.element_to_be_clickable((By.XPATH, self.sel["nav"]["calendar_tab"]))).click()
-        time.sleep(2)
+        self._settle(EC.presence_of_element_located((By.XPATH, self.sel["calendar"]["day_cells"])), self.wait)
 
     def goto_cases(self):
         self.wait.until(EC.element_to_be_clickable((By.XPATH, self.sel["nav"]["cases_tab"]))).click()
-        time.sleep(2)
+        self._settle(EC.presence_of_element_located((By.XPATH, self.sel["case_search"]["anumber_input"])), self.wait)
 
     def iterate_hearings_collect_anums(self, start_date: date, end_date: date):
         self.goto_calendar()
+        cal = self.sel["calendar"]
         a_numbers = set()
         months_checked = 0
         while months_checked < 60:
             months_checked += 1
-            cells = self.driver.find_elements(By.XPATH, self.sel["calendar"]["day_cells"])
+            cells = self.driver.find_elements(By.XPATH, cal["day_cells"])
             for cell in cells:
                 try:
-                    try:
-                        cell.find_element(By.XPATH, self.sel["calendar"]["day_number_in_cell"]).click()
-                    except Exception:
-                        pass
-                    try:
-                        dots = cell.find_elements(By.XPATH, self.sel["calendar"]["hearing_dot"])
-                        if dots:
-                            dots[0].click()
-                    except Exception:
-                        pass
-                    time.sleep(0.5)
-                    rows = self.driver.find_elements(By.XPATH, self.sel["calendar"]["overlay_row"])
-                    if rows:
-                        try:
-                            rows[0].click()
-                            time.sleep(0.5)
-                        except Exception:
-                            pass
-                    popup = self.wait.until(EC.presence_of_element_located((By.XPATH, self.sel["hearing_popup"]["dialog"])))
-                    text = popup.text
-                    date_match = re.search(r"Hearing Date:\s*([^\n]+)", text, re.I)
+                    text = self.driver.execute_async_script(
+                        _DAY_CELL_JS, cell,
+                        cal["day_number_in_cell"], cal["hearing_dot"], cal["overlay_row"],
+                        self.sel["hearing_popup"]["dialog"], self.sel["hearing_popup"]["close"],
+                        10000,
+                    )
+                    if not text:
+                        continue
+                    date_match = _HEARING_DATE_RE.search(text)
                     the_date = date_match.group(1).strip() if date_match else ""
                     in_range = True
                     try:
@@ -199,31 +420,104 @@ class ECASScraper:
                     except Exception:
                         pass
                     if in_range:
-                        anums = re.findall(r"A[#\-\s]*\s*(\d{3}[-\s]?\d{3}[-\s]?\d{3})", text)
+                        anums = _ANUM_RE.findall(text)
                         for a in anums:
-                            a_numbers.add(re.sub(r"[^0-9]", "", a))
-                    try:
-                        popup.find_element(By.XPATH, self.sel["hearing_popup"]["close"]).click()
-                    except Exception:
-                        self.driver.execute_script("document.activeElement?.blur();")
-                    time.sleep(0.2)
+                            a_numbers.add(_NON_DIGIT_RE.sub("", a))
                 except Exception:
                     continue
             try:
-                self.driver.find_element(By.XPATH, self.sel["calendar"]["month_next"]).click()
-                time.sleep(1.0)
+                self.driver.find_element(By.XPATH, cal["month_next"]).click()
+                if cells:
+                    # capped at the old fixed pause in case the calendar re-renders in place
+                    self._settle(EC.staleness_of(cells[0]), WebDriverWait(self.driver, 1, poll_frequency=0.1))
+                self._settle(EC.presence_of_element_located((By.XPATH, cal["day_cells"])))
             except Exception:
                 break
         return sorted(a_numbers)
 
-    def download_case_docs(self, anumber: str, log_rows: list):
+    def _unique(self, name: str, src: Path) -> str:
+        base, ext = os.path.splitext(name)
+        cand = name
+        i = 2
+        while True:
+            while cand.casefold() in self._used_names:
+                cand = f"{base} ({i}){ext}"
+                i += 1
+            self._used_names.add(cand.casefold())
+            # the set is a snapshot; one stat guards against files added since
+            path = self.output_dir / cand
+            if not path.exists() or os.path.samefile(path, src):
+                return cand
+
+    def _scan_for_download(self, since: float):
+        newest = None
+        pending = False
+        with os.scandir(self.download_dir) as it:
+            for entry in it:
+                name = entry.name.lower()
+                if name.endswith(".crdownload"):
+                    pending = pending or entry.stat().st_mtime >= since
+                elif name.endswith(".pdf") and not (
+                        self._downloads_into_output and entry.name.casefold() in self._used_names):
+                    mtime = entry.stat().st_mtime
+                    if mtime >= since and (newest is None or mtime > newest[0]):
+                        newest = (mtime, entry.path)
+        if newest and not pending:
+            return Path(newest[1])
+        return None
+
+    def _start_watcher(self):
+        # started on the first download so sessions that never download don't queue events
+        self._watch_started = True
+        try:
+            self._observer = Observer()
+            self._observer.schedule(self._fs_events, str(self.download_dir), recursive=False)
+            self._observer.start()
+        except Exception as e:
+            print(f"[WARN] Folder watcher unavailable, polling for downloads instead: {e}")
+            self._observer = None
+
+    def _drain_fs_events(self):
+        try:
+            while True:
+                self._fs_events.queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _wait_for_download(self, start_ts: float, timeout: float = 120):
+        # 1s of slack for coarse filesystem mtimes; renamed files are skipped by name
+        since = start_ts - 1
+        deadline = time.time() + timeout
+        if not self._watch_started:
+            self._start_watcher()
+        # watcher events only wake us up; the directory scan decides. The slow
+        # fallback poll covers missed events, the fast one a missing watcher.
+        poll = 2.0 if self._observer else 0.5
+        self._drain_fs_events()
+        while True:
+            found = self._scan_for_download(since)
+            if found:
+                return found
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            try:
+                self._fs_events.queue.get(timeout=min(remaining, poll))
+            except queue.Empty:
+                pass
+            self._drain_fs_events()
+
+    def download_case_docs(self, anumber: str):
         self.goto_cases()
         inp = self.wait.until(EC.presence_of_element_located((By.XPATH, self.sel["case_search"]["anumber_input"])))
         inp.clear(); inp.send_keys(anumber)
         self.wait.until(EC.element_to_be_clickable((By.XPATH, self.sel["case_search"]["search_btn"]))).click()
         self.wait.until(EC.element_to_be_clickable((By.XPATH, self.sel["case_search"]["open_case"]))).click()
         self.wait.until(EC.element_to_be_clickable((By.XPATH, self.sel["case_docs"]["documents_tab"]))).click()
-        time.sleep(1.2)
+        # any table row matches table_rows (e.g. the search results just left), so wait
+        # for a row that actually carries a download button
+        docs = self.sel["case_docs"]
+        self._settle(EC.presence_of_element_located((By.XPATH, f'{docs["table_rows"]}[{docs["download_btn"]}]')))
         rows = self.driver.find_elements(By.XPATH, self.sel["case_docs"]["table_rows"])
         for r in rows:
             try:
@@ -232,37 +526,29 @@ class ECASScraper:
                 btns = r.find_elements(By.XPATH, self.sel["case_docs"]["download_btn"])
                 if not btns:
                     continue
-                before = set(self.download_dir.glob("*.pdf"))
+                start_ts = time.time()
                 btns[0].click()
-                deadline = time.time() + 120
-                downloaded = None
-                while time.time() < deadline:
-                    now = set(self.download_dir.glob("*.pdf"))
-                    new = list(now - before)
-                    if new:
-                        downloaded = new[0]
-                        break
-                    time.sleep(0.5)
+                downloaded = self._wait_for_download(start_ts)
                 if not downloaded:
                     continue
-                text = extract_first_page_text(downloaded)
-                pleading = guess_pleading_name_from_text(text)
-                notes = extract_relevant_dates_text(text) if "ORDER" in label.upper() else ""
+                label_up = label.upper()
+                # a label that already names the pleading type doesn't need page 1 for the filename
+                needs_pleading = not any(k in label_up for k in _PLEADING_KEYWORDS)
+                needs_dates = "ORDER" in label_up
+                text = extract_first_page_text(downloaded) if needs_pleading or needs_dates else ""
+                pleading = guess_pleading_name_from_text(text) if needs_pleading else ""
+                notes = extract_relevant_dates_text(text) if needs_dates else ""
                 newname = build_new_filename(label, pleading, file_date, notes)
-                final_path = self.download_dir / newname
-                i = 2
-                while final_path.exists():
-                    final_path = self.download_dir / (final_path.stem + f" ({i})" + final_path.suffix)
-                    i += 1
-                downloaded.rename(final_path)
-                log_rows.append({
-                    "A-Number": anumber,
-                    "Document Label (ECAS)": label,
-                    "Pleading Name (pg1)": pleading,
-                    "Filing Date (ECAS)": file_date,
-                    "Relevant Dates (extracted)": notes,
-                    "Filename (final)": final_path.name
-                })
+                with _RENAME_LOCK:
+                    final_path = self.output_dir / self._unique(newname, downloaded)
+                    downloaded.rename(final_path)
+                cols = self.log_cols
+                cols["A-Number"].append(anumber)
+                cols["Document Label (ECAS)"].append(label)
+                cols["Pleading Name (pg1)"].append(pleading)
+                cols["Filing Date (ECAS)"].append(file_date)
+                cols["Relevant Dates (extracted)"].append(notes)
+                cols["Filename (final)"].append(final_path.name)
             except Exception as e:
                 print(f"[WARN] Row error for A# {anumber}: {e}")
                 continue
@@ -270,6 +556,69 @@ class ECASScraper:
 def ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
 
+def write_log(xlsx: Path, log_cols: dict):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(HEADERS)
+    for row in zip(*(log_cols[h] for h in HEADERS)):
+        ws.append(row)
+    wb.save(xlsx)
+
+def _download_worker(scraper: ECASScraper, todo: queue.Queue):
+    while True:
+        try:
+            a = todo.get_nowait()
+        except queue.Empty:
+            return
+        print(f"Downloading documents for A# {a} ...")
+        try:
+            scraper.download_case_docs(a)
+        except Exception as e:
+            print(f"[WARN] Case error for A# {a}: {e}")
+
+def download_all(scraper: ECASScraper, anums: list, workers: int) -> dict:
+    log_cols = new_log_columns()
+    if not anums:
+        return log_cols
+    todo = queue.Queue()
+    for a in anums:
+        todo.put(a)
+    # the logged-in session is worker 0; extra workers copy its cookies
+    scrapers = [scraper]
+    extra = []
+    cookies = scraper.driver.get_cookies() if workers > 1 else []
+    try:
+        for i in range(1, min(workers, len(anums))):
+            w = ECASScraper(scraper.output_dir / f"worker_{i}", scraper.selectors_path,
+                            output_dir=scraper.output_dir, used_names=scraper._used_names)
+            extra.append(w)
+            try:
+                w.start()
+                w.adopt_session(cookies)
+            except Exception as e:
+                print(f"[WARN] Could not start download window {i}, continuing without it: {e}")
+                w.close()
+                continue
+            scrapers.append(w)
+        with ThreadPoolExecutor(max_workers=len(scrapers)) as pool:
+            futures = [pool.submit(_download_worker, w, todo) for w in scrapers]
+            for fut in futures:
+                fut.result()
+        for w in scrapers:
+            for h in HEADERS:
+                log_cols[h].extend(w.log_cols[h])
+        # workers finish out of order; restore the sorted A-number order (stable, so
+        # each case keeps its document order)
+        order = sorted(range(len(log_cols["A-Number"])), key=log_cols["A-Number"].__getitem__)
+        return {h: [log_cols[h][i] for i in order] for h in HEADERS}
+    finally:
+        for w in extra:
+            w.close()
+            try:
+                w.download_dir.rmdir()
+            except OSError:
+                pass
+
 def main():
     print("=== ECAS Auto-Harvest Downloader ===")
     email = input("ECAS Email: ").strip()
@@ -277,6 +626,7 @@ def main():
     start = input("Start date (YYYY-MM-DD): ").strip()
     end = input("End date (YYYY-MM-DD): ").strip()
     out_dir = input("Download folder (or leave blank for 'downloads_ecas'): ").strip() or "downloads_ecas"
+    workers = int(input(f"Parallel Chrome windows (or leave blank for {DEFAULT_WORKERS}): ").strip() or DEFAULT_WORKERS)
     start_date = datetime.strptime(start, "%Y-%m-%d").date()
     end_date = datetime.strptime(end, "%Y-%m-%d").date()
     download_dir = Path(out_dir).resolve()
@@ -284,23 +634,24 @@ def main():
     selectors_path = Path(__file__).parent / "selectors.json"
 
     scraper = ECASScraper(download_dir, selectors_path)
-    scraper.start()
-    scraper.login(email, password)
+    try:
+        # only the main session keeps a profile; Chrome locks it, so workers copy its cookies instead
+        scraper.start(profile_dir=PROFILE_DIR)
+        scraper.login(email, password)
 
-    print("Harvesting hearings from calendar...")
-    anums = scraper.iterate_hearings_collect_anums(start_date, end_date)
-    print(f"Found {len(anums)} unique A-numbers in range.")
+        print("Harvesting hearings from calendar...")
+        anums = scraper.iterate_hearings_collect_anums(start_date, end_date)
+        print(f"Found {len(anums)} unique A-numbers in range.")
 
-    log_rows = []
-    for a in anums:
-        print(f"Downloading documents for A# {a} ...")
-        scraper.download_case_docs(a, log_rows)
+        log_cols = download_all(scraper, anums, workers)
 
-    df = pd.DataFrame(log_rows)
-    xlsx = download_dir / f"ecas_download_log_{start_date}_{end_date}.xlsx"
-    df.to_excel(xlsx, index=False)
-    print(f"Saved log: {xlsx}")
-    print("Finished. You can close Chrome now.")
+        xlsx = download_dir / f"ecas_download_log_{start_date}_{end_date}.xlsx"
+        write_log(xlsx, log_cols)
+        print(f"Saved log: {xlsx}")
+    finally:
+        # release the saved profile so the next run can open it
+        scraper.close()
+    print("Finished.")
     time.sleep(2)
 
 if __name__ == "__main__":